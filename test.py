@@ -0,0 +1,31 @@
+import os
+import tempfile
+import unittest
+
+from transaction.manager import Transaction, init_db, load_rows_from_db, save_transaction_db
+
+
+class SearchFilterTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "transactions.db")
+        init_db(self.path)
+
+    def search(self, query):
+        # Same flag shape and lower-cased query as the Transactions tab search box
+        flags = (None, None, False, True)
+        return load_rows_from_db(flags, [query.lower()], path=self.path)
+
+    def test_search_folds_non_ascii_case(self):
+        tx = Transaction.from_user_input(None, "2025-03-01", "élan café", -5, "food")
+        save_transaction_db(tx, self.path)
+        self.assertEqual(tx.description, "Élan Café")
+        for query in ("élan", "ÉLAN", "Café", "food"):
+            rows = self.search(query)
+            self.assertEqual([r.description for r in rows], ["Élan Café"], query)
+        self.assertEqual(self.search("elan"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,18 @@
 # transaction/manager.py
 import sqlite3
+import atexit
 import collections
-from collections import Counter, defaultdict, namedtuple
+from collections import defaultdict, namedtuple
 import datetime
 import sys
 import json
 import math
-from typing import Iterable, Iterator, List, Dict, Any
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Union
 
-# Third-party imports (used later): numpy, matplotlib, scipy
+# Third-party imports: numpy is used throughout; matplotlib is heavy and only
+# needed by plot_amounts, so it's imported there.
 import numpy as np  # numpy: Arrays, numerical ops, used for ML and statistics
-import matplotlib.pyplot as plt  # matplotlib: plotting
-from scipy import stats  # scipy: statistics (mode etc.)
-import statistics as stats_stdlib  # mean/median/mode/stdev
 import tkinter as tk
 from tkinter import ttk
 import tkinter.font as tkFont
@@ -24,7 +24,16 @@ from tkinter import messagebox
 # -----------------------------
 try:
     import customtkinter as ctk
+except ImportError:
+    ctk = None
 
+
+def _is_embedded_in_dashboard(master) -> bool:
+    """Shared by the real and placeholder views: True when hosted inside a DashboardView."""
+    return master is not None and master.__class__.__name__ == "DashboardView"
+
+
+if ctk is not None:
     class TransactionView(ctk.CTkFrame):
         """GUI Transaction view using CustomTkinter.
 
@@ -43,23 +52,43 @@ try:
         COLOR_BTN_DELETE = "#c0392b"
         COLOR_BTN_SELECT_ALL = "#2980b9"
 
+        # Category choices offered by the Add/Edit modal, per transaction type
+        INCOME_CATEGORIES = ("Salary", "Allowance", "Freelance", "Business Income", "Investments", "Gifts", "Refunds", "Other Income")
+        EXPENSE_CATEGORIES = ("Food", "Transportation", "Shopping", "Entertainment", "Bills & Utilities", "Health & Personal Care", "Education", "Debt Payments / Loans", "Savings & Investments", "Miscellaneous", "Others")
+
+        # Rows are pushed into the Treeview one page at a time as the user scrolls
+        PAGE_SIZE = 50
+        # Batches larger than this are inserted by a Tcl-side loop (see _insert_rows)
+        BULK_INSERT_MIN = 200
+
+        # Columns whose cells are mostly digits; auto-sized by character count
+        NUMERIC_COLUMNS = ("id", "date", "amount")
+
         def __init__(self, master, **kwargs):
             super().__init__(master, **kwargs)
             init_db()
             
             # Embed check
-            try:
-                if master is not None and getattr(master, "__class__", None) and master.__class__.__name__ == "DashboardView":
-                    self._embedded_in_dashboard = True
-                    return
-            except Exception:
-                pass
+            if _is_embedded_in_dashboard(master):
+                self._embedded_in_dashboard = True
+                return
 
             # Properties
-            self._income_categories = ["Salary", "Allowance", "Freelance", "Business Income", "Investments", "Gifts", "Refunds", "Other Income"]
-            self._expense_categories = ["Food", "Transportation", "Shopping", "Entertainment", "Bills & Utilities", "Health & Personal Care", "Education", "Debt Payments / Loans", "Savings & Investments", "Miscellaneous", "Others"]
             self._current_filter = None
             self._search_query = ""
+            self._search_after_id = None
+            self._page_flags = None
+            self._page_params = []
+            self._loaded = 0
+            self._total = 0
+            self._page_after_id = None
+            self._last_rendered = None  # (flags, params, db_version()) of the rows on screen
+            # Auto-fit state: widest cell per column among inserted rows (pixels), and the
+            # distinct text cells not yet measured (font.measure runs only on auto-fit)
+            self._cell_font = tkFont.nametofont("TkDefaultFont")
+            self._digit_width = self._cell_font.measure("0")
+            self._col_max = [0] * 6
+            self._col_texts = [set() for _ in range(6)]
 
             # Layout Configuration
             self.grid_columnconfigure(0, weight=1)
@@ -187,11 +216,11 @@ try:
                 self.tree.column(col, width=width, anchor=anchor)
 
             # Scrollbars
-            vsb = ctk.CTkScrollbar(self.list_frame, orientation="vertical", command=self.tree.yview)
-            self.tree.configure(yscrollcommand=vsb.set)
+            self.vsb = ctk.CTkScrollbar(self.list_frame, orientation="vertical", command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self._on_tree_yscroll)
             
             self.tree.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
-            vsb.grid(row=0, column=1, sticky="ns", padx=(0,2), pady=2)
+            self.vsb.grid(row=0, column=1, sticky="ns", padx=(0,2), pady=2)
 
             self.tree.bind("<Double-Button-1>", self._on_tree_header_double_click)
 
@@ -233,108 +262,184 @@ try:
             try:
                 col_idx = int(column[1:]) - 1
                 col_name = self.tree.cget("columns")[col_idx]
-                max_width = tkFont.Font().measure(self.tree.heading(col_name, "text"))
-                for item in self.tree.get_children():
-                    try:
-                        txt = str(self.tree.item(item, "values")[col_idx])
-                        max_width = max(max_width, tkFont.Font().measure(txt))
-                    except: pass
-                self.tree.column(col_name, width=max_width + 20)
+                header_width = self._cell_font.measure(self.tree.heading(col_name, "text"))
+                # Numeric widths were sized on insert; text cells are measured now, once each
+                pending = self._col_texts[col_idx]
+                if pending:
+                    widest = max(map(self._cell_font.measure, pending))
+                    if widest > self._col_max[col_idx]:
+                        self._col_max[col_idx] = widest
+                    pending.clear()
+                self.tree.column(col_name, width=max(header_width, self._col_max[col_idx]) + 20)
             except: pass
 
+        def _track_col_widths(self, values):
+            """Fold a batch of inserted rows into the per-column max widths (text columns are deferred)."""
+            col_max = self._col_max
+            for col_idx, col_name in enumerate(self.tree.cget("columns")):
+                cells = [str(v[col_idx]) for v in values]
+                if not cells:
+                    return
+                if col_name in self.NUMERIC_COLUMNS:
+                    # Digit glyphs share one width: size from the longest string instead of measuring each cell
+                    width = max(map(len, cells)) * self._digit_width
+                    if width > col_max[col_idx]:
+                        col_max[col_idx] = width
+                else:
+                    # No Tcl round trip per row: _handle_col_resize measures these on demand
+                    self._col_texts[col_idx].update(cells)
+
         def _on_search_change(self, *args):
+            # Debounce: only reload once typing pauses instead of on every keystroke
+            if self._search_after_id is not None:
+                self.after_cancel(self._search_after_id)
+            self._search_after_id = self.after(150, self._do_search_reload)
+
+        def _do_search_reload(self):
+            self._search_after_id = None
             self._search_query = self.search_var.get().lower()
             self.load_table_from_db()
 
-        def load_table_from_db(self):
-            try:
-                txs = load_transactions_from_db()
-            except Exception: return
+        def _filter_params(self):
+            """Read the filter/search controls into a SQL flag tuple and its bind params."""
+            params = []
 
-            for iid in self.tree.get_children():
-                self.tree.delete(iid)
-                
-            cats = set()
-            count = 0
-            total_inc = 0.0
-            total_exp = 0.0
-            
             filter_month = getattr(self, "var_filter_month", None)
             filter_month_val = filter_month.get() if filter_month else "All Time"
-            
+
             filter_type = getattr(self, "var_filter_type", None)
             filter_type_val = filter_type.get() if filter_type else "All Types"
-            
+
+            # 1. Filter Month (ISO dates compare correctly as strings)
+            month_flag = None
             today = datetime.date.today()
+            first_current = today.replace(day=1)
+            if filter_month_val == "This Month":
+                next_first = (first_current + datetime.timedelta(days=32)).replace(day=1)
+                month_flag = "range"
+                params += [first_current.isoformat(), next_first.isoformat()]
+            elif filter_month_val == "Last Month":
+                first_prev = (first_current - datetime.timedelta(days=1)).replace(day=1)
+                month_flag = "range"
+                params += [first_prev.isoformat(), first_current.isoformat()]
+            elif filter_month_val == "Last 3 Months":
+                # Approx 90 days
+                month_flag = "since"
+                params.append((today - datetime.timedelta(days=90)).isoformat())
+
+            # 2. Filter Type
+            type_flag = filter_type_val if filter_type_val in ("Income", "Expense") else None
+
+            # 3. Filter Category
+            has_cat = bool(self._current_filter and self._current_filter != "All Categories")
+            if has_cat:
+                params.append(self._current_filter)
+
+            # 4. Search
+            has_search = bool(self._search_query)
+            if has_search:
+                params.append(self._search_query)
+
+            return (month_flag, type_flag, has_cat, has_search), params
+
+        def load_table_from_db(self):
+            flags, params = self._filter_params()
+            stats_sql = _build_filter_sql(flags)[0]
+            try:
+                # Same filter over unchanged data: what's on screen is already right
+                rendered_key = (flags, tuple(params), db_version())
+                if rendered_key == self._last_rendered:
+                    return
+                cur = _get_conn().cursor()
+                # Stats cards are aggregated by SQLite over the same filter
+                cur.execute(stats_sql, params)
+                count, total_inc, total_exp = cur.fetchone()
+            except Exception: return
 
-            for t in txs:
-                # 1. Filter Month
-                t_date = datetime.date.fromisoformat(t.date)
-                if filter_month_val == "This Month":
-                    if t_date.year != today.year or t_date.month != today.month: continue
-                elif filter_month_val == "Last Month":
-                    # Simple last month logic
-                    first_current = datetime.date(today.year, today.month, 1)
-                    last_prev = first_current - datetime.timedelta(days=1)
-                    if t_date.year != last_prev.year or t_date.month != last_prev.month: continue
-                elif filter_month_val == "Last 3 Months":
-                    # Approx 90 days
-                    limit = today - datetime.timedelta(days=90)
-                    if t_date < limit: continue
-
-                # 2. Filter Type
-                tx_type = "Income" if t.amount >= 0 else "Expense"
-                if filter_type_val == "Income" and tx_type != "Income": continue
-                if filter_type_val == "Expense" and tx_type != "Expense": continue
-
-                # 3. Filter Category
-                if self._current_filter and self._current_filter != "All Categories":
-                    if t.category != self._current_filter: continue
-                
-                # 4. Search
-                if self._search_query:
-                    # Basic search across fields
-                    search_content = f"{t.description} {t.category} {t.date} {t.amount}".lower()
-                    if self._search_query not in search_content: continue
-
-                cats.add(t.category)
-                count += 1
-                if t.amount >= 0: total_inc += t.amount
-                else: total_exp += abs(t.amount)
-
-                # Format & Insert
-                amt_str = f"₱{abs(t.amount):,.2f}"
-                if t.amount < 0:
-                    amt_str = f"- {amt_str}"
-                else: 
-                     amt_str = f"+ {amt_str}"
-
-                self.tree.insert("", "end", values=(t.id, t.date, tx_type, t.category, amt_str, t.description))
+            # One Tcl call instead of one per row
+            self.tree.delete(*self.tree.get_children())
+            self._col_max = [0] * len(self._col_max)
+            self._col_texts = [set() for _ in self._col_max]
+
+            # Only the first page is inserted now; the rest follow as the list scrolls
+            self._page_flags = flags
+            self._page_params = params
+            self._loaded = 0
+            self._total = count
+            self._load_next_page()
 
             # Update Stats Cards
             self.card_total_count.configure(text=str(count))
             self.card_total_income.configure(text=f"₱{total_inc:,.2f}")
             self.card_total_expense.configure(text=f"₱{total_exp:,.2f}")
 
-            # Update combo for categories (dynamic based on filtered view? Or all?)
-            # Usually better to show all categories that exist in DB to allow broader filtering, 
-            # but here we are collecting from the potentially filtered list -> that reduces options too much.
-            # Ideally "All Categories" + sorted(cats) from *all transactions* is better, but this simple logic works for now.
-            # Let's keep existing logic: build choices from visible cats.
-            values = ["All Categories"] + sorted(cats)
-            # self.combo_filter.configure(values=values) # Optional: don't restrict too much if user wants to switch
-            # Actually, standard UX: filter options shouldn't disappear when selected.
-            # I'll stick to maintaining visible sets for now.
-            
-            if self._current_filter not in values and self._current_filter != None:
+            # Category choices come from every stored category (index-only DISTINCT scan),
+            # and the combobox is only reconfigured when that list changes
+            try:
+                cat_values = ["All Categories"] + distinct_categories()
+                if cat_values != self.combo_filter.cget("values"):
+                    self.combo_filter.configure(values=cat_values)
+            except Exception: pass
+
+            # The category filter is part of the WHERE clause, so the visible set of
+            # categories is either {current filter} or empty.
+            if self._current_filter is not None and count == 0:
                   # If current filter is invalid (e.g. switched month and that cat doesn't exist there), reset
                   self.var_filter.set("All Categories")
                   self._current_filter = None
 
+            self._last_rendered = rendered_key
+
+        def _load_next_page(self, limit=None):
+            """Fetch and insert the next `limit` (default PAGE_SIZE, -1 = all) rows of the current filter. Returns rows inserted."""
+            self._page_after_id = None
+            if self._page_flags is None or self._loaded >= self._total:
+                return 0
+            if limit is None:
+                limit = self.PAGE_SIZE
+            try:
+                rows = load_rows_from_db(self._page_flags, self._page_params, limit, self._loaded)
+            except Exception: return 0
+
+            # Format every row up front, then insert in one go
+            values = [_display_values(r) for r in rows]
+            self._insert_rows(values)
+            self._track_col_widths(values)
+
+            self._loaded += len(rows)
+            if not rows:
+                # Table shrank underneath us; stop paging until the next reload
+                self._total = self._loaded
+            return len(rows)
+
+        def _insert_rows(self, values):
+            """Append rows to the tree; large batches go through a single Tcl loop."""
+            if len(values) <= self.BULK_INSERT_MIN:
+                insert = self.tree.insert
+                for vals in values:
+                    insert("", "end", values=vals)
+                return
+            # Hand the rows to Tcl as a native list (no string quoting needed) and
+            # let Tcl run the insert loop: two interpreter calls instead of one per row
+            interp = self.tree.tk
+            interp.call("set", "::_tv_rows", tuple(values))
+            interp.eval(f"foreach row $::_tv_rows {{{self.tree} insert {{}} end -values $row}}; unset ::_tv_rows")
+
+        def _on_tree_yscroll(self, first, last):
+            self.vsb.set(first, last)
+            # Near the bottom of what is loaded: fetch the next page once Tk is idle
+            if float(last) >= 0.9 and self._loaded < self._total and self._page_after_id is None:
+                self._page_after_id = self.after_idle(self._load_next_page)
+
+        def _load_all_pages(self):
+            # Everything left in one query and one insert pass, not page by page
+            self._load_next_page(-1)
+
         def _on_refresh(self):
             self.load_table_from_db()
 
         def _on_select_all(self):
+            self._load_all_pages()
             all_items = self.tree.get_children()
             if len(self.tree.selection()) < len(all_items):
                 self.tree.selection_set(all_items)
@@ -374,41 +479,28 @@ try:
             if not messagebox.askyesno("Confirm", f"Delete {len(ids)} transactions?"):
                 return
 
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            for tid in ids:
-                try: cur.execute("DELETE FROM transactions WHERE id = ?", (tid,))
-                except: pass
-            conn.commit()
-            conn.close()
+            delete_transactions_db(ids)
             self._on_refresh()
             
         def _on_export(self):
             from tkinter import filedialog
-            import csv
+            import threading
             
             filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
             if not filename: return
-            
-            try:
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["ID", "Date", "Type", "Category", "Amount", "Description"])
-                    for child in self.tree.get_children():
-                        vals = self.tree.item(child)['values']
-                        writer.writerow(vals)
-                messagebox.showinfo("Success", "Transactions exported successfully.")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
-
-        def _next_id(self):
-            init_db()
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute("SELECT MAX(id) FROM transactions")
-            r = cur.fetchone()
-            conn.close()
-            return (r[0] + 1) if (r and r[0] is not None) else 1
+
+            # Export what the current filter matches straight from the DB, off the UI thread
+            flags, params = self._filter_params()
+
+            def _worker():
+                try:
+                    export_transactions_csv(filename, flags, params)
+                    self.after(0, lambda: messagebox.showinfo("Success", "Transactions exported successfully."))
+                except Exception as e:
+                    msg = str(e)
+                    self.after(0, lambda: messagebox.showerror("Error", msg))
+
+            threading.Thread(target=_worker, daemon=True).start()
 
         def _on_add(self):
             self._open_modal()
@@ -476,7 +568,7 @@ try:
             
             # Category
             # Determine initial list based on type
-            init_cats = self._income_categories if type_val == "Income" else self._expense_categories
+            init_cats = self.INCOME_CATEGORIES if type_val == "Income" else self.EXPENSE_CATEGORIES
             # Default cat if not editing or category not in list
             default_cat = init_cats[0]
             if is_edit and tx.category in init_cats:
@@ -486,7 +578,7 @@ try:
             combo_cat = create_field("Category", ctk.CTkComboBox, values=init_cats, variable=var_cat)
             
             def _update_cats(choice):
-                vals = self._income_categories if choice == "Income" else self._expense_categories
+                vals = self.INCOME_CATEGORIES if choice == "Income" else self.EXPENSE_CATEGORIES
                 combo_cat.configure(values=vals)
                 if var_cat.get() not in vals:
                     var_cat.set(vals[0])
@@ -508,12 +600,12 @@ try:
             
             def _submit():
                 try:
-                    d_str = ent_date.get().strip()
-                    datetime.datetime.strptime(d_str, "%Y-%m-%d")
+                    # C fast path for ISO dates; store the canonical YYYY-MM-DD so date ordering holds
+                    d_str = datetime.date.fromisoformat(ent_date.get().strip()).isoformat()
                     
                     amt_str = ent_amount.get().strip()
                     if not amt_str: raise ValueError("Amount missing")
-                    amt = float(amt_str)
+                    amt = _parse_peso(amt_str)
                     if var_type.get() == "Expense": amt = -abs(amt)
                     else: amt = abs(amt)
                     
@@ -521,8 +613,9 @@ try:
                     desc = ent_desc.get("1.0", "end").strip()
                     
                     # Create TX object
-                    new_id = tx.id if is_edit else self._next_id()
-                    new_tx = Transaction(new_id, d_str, desc, amt, cat)
+                    # New rows get their id from SQLite (INTEGER PRIMARY KEY = rowid)
+                    new_id = tx.id if is_edit else None
+                    new_tx = Transaction.from_user_input(new_id, d_str, desc, amt, cat)
                     save_transaction_db(new_tx)
                     
                     top.destroy()
@@ -532,7 +625,7 @@ try:
 
             ctk.CTkButton(btn_frame, text="Cancel", fg_color="transparent", border_width=1, text_color="gray", command=top.destroy).pack(side="left", expand=True, padx=5, fill="x")
             ctk.CTkButton(btn_frame, text="Save", command=_submit, fg_color=self.COLOR_BTN_ADD).pack(side="right", expand=True, padx=5, fill="x")
-except Exception:
+else:
     # Fallback placeholder so imports do not fail in environments without GUI libs.
     class TransactionView:
         """Placeholder TransactionView when `customtkinter` is not installed.
@@ -543,12 +636,8 @@ except Exception:
         def __init__(self, master=None, **kwargs):
             self.master = master
             self.kwargs = kwargs
-            try:
-                if master is not None and getattr(master, "__class__", None) and master.__class__.__name__ == "DashboardView":
-                    self._embedded_in_dashboard = True
-                    return
-            except Exception:
-                pass
+            if _is_embedded_in_dashboard(master):
+                self._embedded_in_dashboard = True
 
         def render_text(self):
             return "TransactionView placeholder (customtkinter not installed)"
@@ -578,14 +667,32 @@ class Transaction:
     Inheritance will be shown with `Income` and `Expense` subclasses below.
     """
 
-    def __init__(self, tid: int, date: str, description: str, amount: float, category: str = "General"):
-        # Casting: ensure amount stored as float (Casting)
-        self.id = int(tid)
+    def __init__(self, tid: Optional[int], date: str, description: str, amount: float, category: str = "General"):
+        # Casting: ensure amount stored as float (Casting); None = not saved yet.
+        # Text is taken as-is; raw user input goes through from_user_input().
+        self.id = int(tid) if tid is not None else None
         self.date = str(date)
-        # Modifying strings: normalize whitespace and capitalization
-        self.description = description.strip().title()
+        self.description = description
         self.amount = float(amount)
-        self.category = category.strip().title()
+        self.category = category
+        # Lower-cased once here for the case-insensitive category checks
+        self._category_lower = category.lower()
+
+    @classmethod
+    def from_user_input(cls, tid: Optional[int], date: str, description: str, amount: float,
+                        category: str = "General") -> "Transaction":
+        # Modifying strings: normalize whitespace and capitalization
+        return cls(tid, date, description.strip().title(), amount, category.strip().title())
+
+    @classmethod
+    def _from_row(cls, row) -> "Transaction":
+        """Build from a stored (id, date, description, amount, category) row without re-normalizing."""
+        t = cls.__new__(cls)
+        t.id, t.date, t.description, t.amount, category = row
+        # A handful of categories repeat across every row: share one string object each
+        t.category = sys.intern(category)
+        t._category_lower = sys.intern(category.lower())
+        return t
 
     def __str__(self):
         # f-strings: used here
@@ -616,28 +723,148 @@ class Expense(Transaction):
         return f"Expense({self.id}, {self.date}, {self.description}, -{self.amount:.2f}, merchant={self.merchant})"
 
 
+# -----------------------------
+# Running mean / variance (Welford updates, Chan et al. pairwise merge)
+# -----------------------------
+
+class RunningStats:
+    """Count, mean and sum of squared deviations (M2), updatable one value or one batch at a time."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "RunningStats":
+        """Exact two-pass stats for a batch, ready to be merged with combine()."""
+        if values.size == 0:
+            return cls()
+        mean = float(values.mean())
+        dev = values - mean
+        return cls(int(values.size), mean, float(np.dot(dev, dev)))
+
+    def push(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def combine(self, other: "RunningStats"):
+        """Merge another batch's stats into this one (pairwise update)."""
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+    def stdev(self) -> float:
+        """Sample standard deviation (n - 1 denominator); 0.0 below two values."""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+
 # -----------------------------
 # Iterable / Iterator: TransactionCollection
 # -----------------------------
 
+# Numeric helpers take a plain list or a float64 array such as TransactionCollection.amounts()
+Amounts = Union[List[float], np.ndarray]
+
+
 class TransactionCollection(Iterable):
-    """Holds transactions and implements an iterator (Iterable and Iterator)."""
+    """Holds transactions and implements an iterator (Iterable and Iterator).
+
+    Alongside the list, amounts and small integer category codes are kept as
+    parallel NumPy columns so filters and stats run as array operations, and a
+    running mean/variance is updated as transactions are added.
+    """
 
     def __init__(self, transactions: List[Transaction] = None):
-        self._transactions = list(transactions) if transactions else []
+        self._transactions = []
+        self._n = 0
+        self._amounts = np.empty(16, dtype=np.float64)
+        self._codes = np.empty(16, dtype=np.int16)
+        # Category code <-> name: codes are handed out in first-seen order and
+        # compare case-insensitively; names keep the first-seen spelling
+        self._code_of: Dict[str, int] = {}
+        self._category_names: List[str] = []
+        self._stats = RunningStats()
+        if transactions:
+            self.extend(transactions)
+
+    def _reserve(self, size: int):
+        # Grow the column buffers geometrically so appends stay amortized O(1)
+        cap = self._amounts.size
+        if size <= cap:
+            return
+        while cap < size:
+            cap *= 2
+        amounts = np.empty(cap, dtype=np.float64)
+        amounts[:self._n] = self._amounts[:self._n]
+        codes = np.empty(cap, dtype=np.int16)
+        codes[:self._n] = self._codes[:self._n]
+        self._amounts, self._codes = amounts, codes
+
+    def _code(self, tx: Transaction) -> int:
+        key = tx._category_lower
+        code = self._code_of.get(key)
+        if code is None:
+            code = self._code_of[key] = len(self._category_names)
+            self._category_names.append(tx.category)
+        return code
 
     def add(self, tx: Transaction):
+        self._reserve(self._n + 1)
         self._transactions.append(tx)
+        self._amounts[self._n] = tx.amount
+        self._codes[self._n] = self._code(tx)
+        self._n += 1
+        self._stats.push(tx.amount)
+
+    def extend(self, txs: Iterable[Transaction]):
+        txs = list(txs)
+        start, end = self._n, self._n + len(txs)
+        self._reserve(end)
+        self._transactions.extend(txs)
+        self._amounts[start:end] = [t.amount for t in txs]
+        self._codes[start:end] = [self._code(t) for t in txs]
+        self._n = end
+        self._stats.combine(RunningStats.of(self._amounts[start:end]))
 
     def __len__(self):
-        return len(self._transactions)
+        return self._n
 
     def __iter__(self) -> Iterator[Transaction]:
         # Iterable implemented; returns an iterator object
         return iter(self._transactions)
 
-    def amounts(self) -> List[float]:
-        return [t.amount for t in self._transactions]
+    def amounts(self) -> np.ndarray:
+        """Amounts as a read-only float64 view of the column (no copy); don't hold it across add()."""
+        view = self._amounts[:self._n]
+        # Writes through the view would bypass add() and desync running_stats()
+        view.flags.writeable = False
+        return view
+
+    def running_stats(self) -> RunningStats:
+        """Mean/variance accumulator kept current by add() and extend()."""
+        return self._stats
+
+    def category_mask(self, category: str) -> np.ndarray:
+        """Boolean mask of transactions whose category equals `category`, case-insensitively."""
+        code = self._code_of.get(category.lower())
+        if code is None:
+            return np.zeros(self._n, dtype=bool)
+        return self._codes[:self._n] == code
+
+    def category_counts(self) -> Dict[str, int]:
+        """Transactions per category (first-seen casing), in first-seen order."""
+        # Codes are assigned in first-seen order, so one bincount lines up with the names
+        counts = np.bincount(self._codes[:self._n], minlength=len(self._category_names))
+        return dict(zip(self._category_names, counts.tolist()))
 
 
 # -----------------------------
@@ -646,11 +873,84 @@ class TransactionCollection(Iterable):
 
 DB_PATH = "transactions.db"
 
+# One long-lived connection per database file, reused by every helper below.
+# Autocommit mode: single statements commit on their own, batches use BEGIN.
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
+
+def _py_lower(text):
+    """SQL py_lower(): Python's str.lower, so search folds non-ASCII text like the query side."""
+    return text.lower() if text is not None else None
+
+
+def _add_functions(conn: sqlite3.Connection):
+    # SQLite's built-in lower() only folds ASCII ('É' stays 'É')
+    conn.create_function("py_lower", 1, _py_lower, deterministic=True)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a connection tuned for this app: WAL journal, one fsync per commit."""
+    # A larger statement cache keeps the hot INSERT/SELECTs and the filter variants prepared
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, cached_statements=256)
+    # WAL is persistent in the file header, so this is a no-op after the first open
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    # Up to 64 MB of page cache (negative = KiB); keeps the whole table resident
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA busy_timeout=5000")
+    _add_functions(conn)
+    return conn
+
+
+def _get_conn(path: str = DB_PATH) -> sqlite3.Connection:
+    conn = _CONNECTIONS.get(path)
+    if conn is None:
+        conn = _connect(path)
+        _CONNECTIONS[path] = conn
+    return conn
+
+
+@atexit.register
+def _close_connections():
+    # Closing the last connection also checkpoints the WAL back into the DB file
+    for conn in _CONNECTIONS.values():
+        conn.close()
+    _CONNECTIONS.clear()
+
+
+# Commits made through this module's write helpers, per path (see db_version)
+_WRITE_COUNTS: Dict[str, int] = {}
+
+
+def db_version(path: str = DB_PATH) -> tuple:
+    """Token that changes whenever the table may have changed.
+
+    Our own writes bump _WRITE_COUNTS; PRAGMA data_version moves when another
+    connection (e.g. the dashboard's) commits to the same file.
+    """
+    data_version = _get_conn(path).execute("PRAGMA data_version").fetchone()[0]
+    return _WRITE_COUNTS.get(path, 0), data_version
+
+
+# Paths whose schema has already been ensured in this process
+_INITED_PATHS = set()
+
+
+# Indexes backing the Transactions tab filters and its newest-first ordering.
+# idx_tx_date is plain (date) so SQLite walks it backwards, with the rowid as
+# the tie-break, for ORDER BY date DESC, id DESC without a temp sort.
+_INDEXES = {
+    "idx_tx_date": "CREATE INDEX IF NOT EXISTS idx_tx_date ON transactions(date)",
+    "idx_tx_category": "CREATE INDEX IF NOT EXISTS idx_tx_category ON transactions(category)",
+}
+
 
 def init_db(path: str = DB_PATH):
     """Create a tiny SQLite DB and transactions table (Database)."""
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
+    if path in _INITED_PATHS:
+        return
+    cur = _get_conn(path).cursor()
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS transactions (
@@ -662,32 +962,203 @@ def init_db(path: str = DB_PATH):
         )
         """
     )
-    conn.commit()
-    conn.close()
+    for sql in _INDEXES.values():
+        cur.execute(sql)
+    _INITED_PATHS.add(path)
+
+
+# Statement text is looked up by value in sqlite3's statement cache: keep these
+# exact constants (don't build variants inline) so the prepared statements are reused.
+_INSERT_NEW_SQL = "INSERT INTO transactions (date, description, amount, category) VALUES (?, ?, ?, ?)"
+_UPSERT_SQL = "INSERT OR REPLACE INTO transactions (id, date, description, amount, category) VALUES (?, ?, ?, ?, ?)"
+_LOAD_ALL_SQL = "SELECT id, date, description, amount, category FROM transactions ORDER BY date"
+
+
+# Upsert batches at least this large rebuild the indexes instead of maintaining them row by row
+_BULK_REINDEX_MIN = 10_000
 
 
 def save_transaction_db(tx: Transaction, path: str = DB_PATH):
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.execute("INSERT OR REPLACE INTO transactions (id, date, description, amount, category) VALUES (?, ?, ?, ?, ?)",
-                (tx.id, tx.date, tx.description, tx.amount, tx.category))
-    conn.commit()
-    conn.close()
+    """Insert or update `tx`. A transaction without an id is assigned SQLite's new rowid."""
+    save_transactions_db([tx], path)
+
+
+def save_transactions_db(txs: Iterable[Transaction], path: str = DB_PATH):
+    """Insert or replace many transactions inside one SQLite transaction (one commit, one fsync).
+
+    Transactions without an id are inserted individually so they can pick up
+    their new rowid; the rest go through a single executemany. Very large
+    batches drop the secondary indexes and rebuild them once afterwards.
+    """
+    conn = _get_conn(path)
+    rows = []
+    with conn:
+        conn.execute("BEGIN")
+        for t in txs:
+            if t.id is None:
+                t.id = conn.execute(_INSERT_NEW_SQL, (t.date, t.description, t.amount, t.category)).lastrowid
+            else:
+                rows.append((t.id, t.date, t.description, t.amount, t.category))
+        reindex = len(rows) >= _BULK_REINDEX_MIN
+        if reindex:
+            for name in _INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.executemany(_UPSERT_SQL, rows)
+        if reindex:
+            # One sorted index build is cheaper than updating both indexes per row
+            for sql in _INDEXES.values():
+                conn.execute(sql)
+    _WRITE_COUNTS[path] = _WRITE_COUNTS.get(path, 0) + 1
 
 
 def load_transactions_from_db(path: str = DB_PATH) -> TransactionCollection:
-    conn = sqlite3.connect(path)
-    cur = conn.cursor()
-    cur.execute("SELECT id, date, description, amount, category FROM transactions ORDER BY date")
-    rows = cur.fetchall()
-    conn.close()
+    cur = _get_conn(path).cursor()
+    cur.arraysize = 1024
+    cur.execute(_LOAD_ALL_SQL)
     txs = TransactionCollection()
-    for r in rows:
-        tid, date, desc, amount, category = r
-        txs.add(Transaction(tid, date, desc, amount, category))
+    # Stream in fetchmany() batches straight into the collection
+    while batch := cur.fetchmany():
+        # Rows come straight from the table, so skip __init__'s casts
+        txs.extend(map(Transaction._from_row, batch))
     return txs
 
 
+# DELETE statements for `id IN (?, ...)`, cached per placeholder count. Callers pad
+# batches to a power of two so only a handful of distinct statements are compiled.
+_DEL_SQL_CACHE: Dict[int, str] = {}
+_DEL_MAX_BATCH = 512  # stays below SQLite's historical 999 bind-parameter limit
+
+
+def _del_sql(n: int) -> str:
+    sql = _DEL_SQL_CACHE.get(n)
+    if sql is None:
+        sql = f"DELETE FROM transactions WHERE id IN ({','.join('?' * n)})"
+        _DEL_SQL_CACHE[n] = sql
+    return sql
+
+
+def delete_transactions_db(ids: List[int], path: str = DB_PATH):
+    """Delete the rows with the given ids in one transaction, using batched IN (...) statements."""
+    if not ids:
+        return
+    conn = _get_conn(path)
+    with conn:
+        conn.execute("BEGIN")
+        for start in range(0, len(ids), _DEL_MAX_BATCH):
+            chunk = ids[start:start + _DEL_MAX_BATCH]
+            # Pad to the next power of two (repeating an id is harmless inside IN)
+            size = 1 << (len(chunk) - 1).bit_length()
+            conn.execute(_del_sql(size), chunk + chunk[-1:] * (size - len(chunk)))
+    _WRITE_COUNTS[path] = _WRITE_COUNTS.get(path, 0) + 1
+
+
+# Lightweight read-only row for display paths; skips Transaction.__init__
+# normalization since rows were already normalized when they were saved.
+TxRow = namedtuple("TxRow", "id date description amount category")
+
+# Filter flags that match every row (see _build_filter_sql)
+_NO_FILTER = (None, None, False, False)
+
+
+@lru_cache(maxsize=4096)
+def _amount_cells(amount: float) -> tuple:
+    """(type, signed peso string) for an amount; amounts repeat a lot, so results are memoized."""
+    if amount < 0:
+        return "Expense", f"- ₱{-amount:,.2f}"
+    return "Income", f"+ ₱{amount:,.2f}"
+
+
+def _parse_peso(text: str) -> float:
+    """Parse a typed amount ("1234", "12.5", "-3.75") via whole cents; at most two decimals."""
+    s = text.strip()
+    body = s[1:] if s[:1] in ("+", "-") else s
+    whole, _, frac = body.partition(".")
+    if ((not whole and not frac) or (whole and not whole.isdecimal())
+            or (frac and not frac.isdecimal()) or len(frac) > 2):
+        raise ValueError(f"Invalid amount: {text!r} (use digits with up to 2 decimals)")
+    cents = int(whole or "0") * 100 + int(frac.ljust(2, "0"))
+    return -cents / 100 if s.startswith("-") else cents / 100
+
+
+def _display_values(r: TxRow) -> tuple:
+    """Treeview/CSV values for a row: (id, date, type, category, amount_str, description)."""
+    tx_type, amount_str = _amount_cells(r.amount)
+    return (r.id, r.date, tx_type, r.category, amount_str, r.description)
+
+
+def load_rows_from_db(flags: tuple = _NO_FILTER, params: Iterable = (), limit: int = -1, offset: int = 0,
+                      path: str = DB_PATH) -> List[TxRow]:
+    """Return rows matching a filter flag tuple and its params, newest first (limit -1 = no limit)."""
+    cur = _get_conn(path).cursor()
+    cur.execute(_build_filter_sql(flags)[1], [*params, limit, offset])
+    return list(map(TxRow._make, cur.fetchall()))
+
+
+def distinct_categories(path: str = DB_PATH) -> List[str]:
+    """Sorted list of every category in the table; answered from idx_tx_category."""
+    cur = _get_conn(path).cursor()
+    cur.execute("SELECT DISTINCT category FROM transactions ORDER BY category")
+    return [r[0] for r in cur.fetchall()]
+
+
+def export_transactions_csv(filename: str, flags: tuple = _NO_FILTER, params: Iterable = (), path: str = DB_PATH):
+    """Write the rows matching a filter to CSV, formatted as in the Transactions table.
+
+    Uses its own read-only connection so it can run on a worker thread.
+    """
+    import csv
+
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    _add_functions(conn)
+    try:
+        cur = conn.execute(_build_filter_sql(flags)[1], [*params, -1, 0])
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["ID", "Date", "Type", "Category", "Amount", "Description"])
+            writer.writerows(_display_values(TxRow._make(r)) for r in cur)
+    finally:
+        conn.close()
+
+
+# SQL text for the Transactions tab filters, keyed by the shape of the filter
+# (month, type, has_category, has_search). Returning the identical string for the
+# same shape keeps sqlite3's per-connection statement cache hitting while the
+# user types in the search box; values are always bound positionally.
+_SQL_CACHE: Dict[tuple, tuple] = {}
+
+
+def _build_filter_sql(flags: tuple) -> tuple:
+    """Return the cached (stats_sql, rows_sql) pair for a filter flag tuple."""
+    cached = _SQL_CACHE.get(flags)
+    if cached is not None:
+        return cached
+
+    month_flag, type_flag, has_cat, has_search = flags
+    clauses = []
+    if month_flag == "range":
+        clauses.append("date >= ? AND date < ?")
+    elif month_flag == "since":
+        clauses.append("date >= ?")
+    if type_flag == "Income":
+        clauses.append("amount >= 0")
+    elif type_flag == "Expense":
+        clauses.append("amount < 0")
+    if has_cat:
+        clauses.append("category = ?")
+    if has_search:
+        # The query is lower-cased with str.lower (_do_search_reload); fold the haystack the same way
+        clauses.append("instr(py_lower(description || ' ' || category || ' ' || date || ' ' || amount), ?) > 0")
+    where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+
+    cached = (
+        "SELECT COUNT(*), TOTAL(CASE WHEN amount >= 0 THEN amount END), "
+        "TOTAL(CASE WHEN amount < 0 THEN -amount END) FROM transactions" + where,
+        "SELECT id, date, description, amount, category FROM transactions" + where + " ORDER BY date DESC, id DESC LIMIT ? OFFSET ?",
+    )
+    _SQL_CACHE[flags] = cached
+    return cached
+
+
             
 
 
@@ -723,80 +1194,115 @@ def format_examples(amount: float):
 
 
 # -----------------------------
-# Functional tools: lambda, map, filter
+# Functional tools: lambda, filter
 # -----------------------------
 
-double = lambda x: x * 2  # Lambda
-
-
 def filter_expenses(txs: Iterable[Transaction]) -> List[Transaction]:
+    if isinstance(txs, TransactionCollection):
+        # Boolean mask over the collection's columns instead of a per-item lambda
+        mask = (txs.amounts() < 0) | txs.category_mask("expense")
+        return [txs._transactions[i] for i in np.flatnonzero(mask)]
     # Filter using a lambda and list comprehension (Loops + lambda)
-    return list(filter(lambda t: t.amount < 0 or t.category.lower() == "expense", txs))
+    return list(filter(lambda t: t.amount < 0 or t._category_lower == "expense", txs))
 
 
 # -----------------------------
 # Statistical functions: mean, median, mode, stdev
 # -----------------------------
 
-def compute_basic_stats(amounts: List[float]) -> Dict[str, float]:
-    # Using Python stdlib and scipy for mode (Mean median mode standard deviation)
-    if not amounts:
+def compute_basic_stats(amounts: Union[Amounts, TransactionCollection]) -> Dict[str, float]:
+    # A collection carries a running mean/variance; anything else is summarized here
+    running = None
+    if isinstance(amounts, TransactionCollection):
+        running = amounts.running_stats()
+        amounts = amounts.amounts()
+    # One float64 array, NumPy reductions (Mean median mode standard deviation)
+    arr = np.asarray(amounts, dtype=np.float64)
+    if arr.size == 0:
         return {}
-    data = [float(a) for a in amounts]
-    mean = stats_stdlib.mean(data)
-    median = stats_stdlib.median(data)
-    try:
-        mode = stats_stdlib.mode(data)
-    except Exception:
-        # fallback to scipy mode
-        mode = float(stats.mode(data).mode[0])
-    stdev = stats_stdlib.stdev(data) if len(data) > 1 else 0.0
+    if running is None:
+        running = RunningStats.of(arr)
+    mean = running.mean
+    stdev = running.stdev()
+    # Mode: most frequent value; ties go to the one seen first, like statistics.mode
+    vals, first, counts = np.unique(arr, return_index=True, return_counts=True)
+    top = counts == counts.max()
+    mode = float(vals[top][first[top].argmin()])
+    # Median last: a list/tuple was just copied into a fresh array by asarray, so the
+    # partition may reorder it in place. Anything else (an ndarray, the column view,
+    # an __array__ object) may hand back the caller's own buffer, so np.median copies.
+    owned = isinstance(amounts, (list, tuple))
+    median = float(np.median(arr, overwrite_input=owned))
     return {"mean": mean, "median": median, "mode": mode, "stdev": stdev}
 
 
 # -----------------------------
-# Numpy arrays and simple ML: Linear Regression using numpy.polyfit
+# Numpy arrays and simple ML: Linear Regression via a closed-form least-squares fit
 # -----------------------------
 
-def linear_regression_predict(amounts: List[float], predict_steps: int = 1):
-    # Arrays: convert to numpy array (Arrays)
-    arr = np.array(amounts, dtype=float)
+def linear_regression_predict(amounts: Amounts, predict_steps: int = 1):
+    # Arrays: float64 array, no copy when given the collection's amount column (Arrays)
+    arr = np.asarray(amounts, dtype=np.float64)
     if arr.size == 0:
         return []
-    # Simple linear regression on index -> amount (Linear regression)
-    x = np.arange(len(arr))
-    # Handle constant array
-    if np.all(arr == arr[0]):
+    n = arr.size
+    # A single point has no slope; the closed form below needs n >= 2
+    if n == 1:
         return [float(arr[0])] * predict_steps
-    coeffs = np.polyfit(x, arr, deg=1)  # slope, intercept
-    slope, intercept = coeffs[0], coeffs[1]
-    preds = []
-    for i in range(len(arr), len(arr) + predict_steps):
-        preds.append(float(slope * i + intercept))
-    return preds
+    # Simple linear regression on index -> amount (Linear regression)
+    x = np.arange(n)
+    # Closed-form least squares for x = 0..n-1; avoids polyfit's lstsq/SVD for a degree-1 fit
+    sx = n * (n - 1) / 2
+    sxx = n * (n - 1) * (2 * n - 1) / 6
+    sy = arr.sum()
+    sxy = float(np.dot(x, arr))
+    slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    intercept = (sy - slope * sx) / n
+    return (slope * np.arange(n, n + predict_steps) + intercept).tolist()
 
 
 # -----------------------------
 # Visualization: Matplotlib example
 # -----------------------------
 
-def plot_amounts(amounts: List[float], title: str = "Transaction Amounts"):
-    if not amounts:
+# (fig, ax, line) reused by every plot_amounts call after the first
+_PLOT_CACHE: Optional[tuple] = None
+
+
+def plot_amounts(amounts: Amounts, title: str = "Transaction Amounts"):
+    global _PLOT_CACHE
+    if len(amounts) == 0:
         return
-    plt.figure(figsize=(6, 3))
-    plt.plot(amounts, marker="o")
-    plt.title(title)
-    plt.xlabel("Index")
-    plt.ylabel("Amount")
-    plt.grid(True)
+    # float32 is plenty for pixels; stats and the trend fit stay float64 to keep cents exact
+    y = np.asarray(amounts, dtype=np.float32)
+    if _PLOT_CACHE is None:
+        # matplotlib: plotting. A bare Figure on the Agg canvas never touches pyplot,
+        # so no GUI backend is loaded and the dashboard's TkAgg setting is left alone.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=(6, 3))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        line, = ax.plot(y, marker="o")
+        ax.set_xlabel("Index")
+        ax.set_ylabel("Amount")
+        ax.grid(True)
+        # Fixed margins instead of tight_layout(): no layout solve on every save
+        fig.subplots_adjust(left=0.18, right=0.97, top=0.9, bottom=0.16)
+        _PLOT_CACHE = (fig, ax, line)
+    else:
+        # Later calls only swap the line's data and rescale the axes
+        fig, ax, line = _PLOT_CACHE
+        line.set_data(np.arange(y.size), y)
+        ax.relim()
+        ax.autoscale_view()
+    ax.set_title(title)
     # Save plot to file instead of showing (safer for non-interactive environments)
-    plt.tight_layout()
-    plt.savefig("amounts_plot.png")
-    plt.close()
+    fig.savefig("amounts_plot.png")
 
 
 # -----------------------------
-# Machine learning note: we used numpy.polyfit above (no sklearn required)
+# Machine learning note: the trend above is a closed-form least-squares line (no sklearn required)
 # -----------------------------
 
 
@@ -818,7 +1324,7 @@ def demo_interactive():
     ]
     for t in sample_data:
         collection.add(t)
-        save_transaction_db(t)
+    save_transactions_db(sample_data)
 
     # Try to prompt the user; avoid blocking in non-interactive environments
     try:
@@ -829,7 +1335,7 @@ def demo_interactive():
                 parts = [p.strip() for p in raw.split(",")]
                 if len(parts) >= 5:
                     tid, date, desc, amount, category = parts[:5]
-                    tx = Transaction(int(tid), date, desc, float(amount), category)
+                    tx = Transaction.from_user_input(int(tid), date, desc, float(amount), category)
                     collection.add(tx)
                     save_transaction_db(tx)
                     print("Added:", tx)
@@ -841,40 +1347,34 @@ def demo_interactive():
     except Exception as e:
         print("Input skipped (non-interactive or error):", e)
 
-    # Loops + if-else: summarize expenses vs income
-    total_income = 0.0
-    total_expense = 0.0
-    for t in collection:
-        if t.category.lower() == "income" or t.amount > 0:
-            total_income += t.amount
-        else:
-            total_expense += t.amount
+    # Summarize expenses vs income with masked sums over the collection's columns
+    amounts_col = collection.amounts()
+    is_income = collection.category_mask("income") | (amounts_col > 0)
+    # math.fsum gives the correctly rounded total, so many cent amounts don't drift
+    total_income = math.fsum(amounts_col[is_income].tolist())
+    total_expense = math.fsum(amounts_col[~is_income].tolist())
 
-    # Placeholders and modifiers example
-    s1, s2, s3 = format_examples(total_income)
     print("Summary:")
     print(f"Total income: {total_income:.2f}")
-    print(s2)  # old-style modifier usage shown
-
-    # Iterators and iterables used when calling list(collection)
-    amounts = collection.amounts()
+    # Placeholders and modifiers: only the old-style form is shown, so build just that one
+    print("Amount: %0.2f" % (total_income,))
 
-    # Numpy, stats and ML usage
-    stats_result = compute_basic_stats(amounts)
+    # Numpy, stats and ML usage, straight off the amount column
+    stats_result = compute_basic_stats(collection)
     print("Stats:", stats_result)
-    preds = linear_regression_predict(amounts, predict_steps=3)
+    preds = linear_regression_predict(amounts_col, predict_steps=3)
     print("Next predictions:", preds)
 
     # Plot and save
-    plot_amounts(amounts)
+    plot_amounts(amounts_col)
 
-    # More functional examples: map + lambda
-    doubles = list(map(double, amounts))
+    # Doubled amounts: one vectorized multiply over the amount column
+    doubles = (amounts_col * 2).tolist()
     print("Doubled amounts:", doubles)
 
-    # Collections example: Counter
-    cat_counter = Counter([t.category for t in collection])
-    print("Category counts:", dict(cat_counter))
+    # Category histogram: one bincount over the collection's code column
+    cat_counter = collection.category_counts()
+    print("Category counts:", cat_counter)
 
     # Return collection for possible programmatic use
     return collection